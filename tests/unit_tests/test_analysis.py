@@ -0,0 +1,39 @@
+import logging
+
+import numpy as np
+import pytest
+from gammapy.datasets import SpectrumDatasetOnOff
+from gammapy.maps import MapAxis, RegionGeom
+
+import v2dl5.analysis as v2dl5_analysis
+
+logger = logging.getLogger()
+logger.setLevel(logging.DEBUG)
+
+
+@pytest.fixture
+def get_dataset():
+    energy_axis = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=5, name="energy")
+    energy_axis_true = MapAxis.from_energy_bounds("0.05 TeV", "20 TeV", nbin=10, name="energy_true")
+    geom = RegionGeom.create("icrs;circle(83.63, 22.01, 0.1)", axes=[energy_axis])
+    dataset = SpectrumDatasetOnOff.create(
+        geom=geom, energy_axis_true=energy_axis_true, name="64080"
+    )
+    dataset.counts.data += np.arange(5).reshape(dataset.counts.data.shape)
+    dataset.counts_off.data += 2 * np.arange(5).reshape(dataset.counts_off.data.shape)
+    dataset.acceptance.data += 1.0
+    dataset.acceptance_off.data += 5.0
+    return dataset
+
+
+class TestWriteFitsDataset:
+    # Datasets written in memory can be read with gammapy (compressed and uncompressed).
+    @pytest.mark.parametrize("file_name", ["64080.fits.gz", "64080.fits"])
+    def test_write_fits_dataset(self, get_dataset, tmp_path, file_name):
+        out_file = tmp_path / "data" / file_name
+        v2dl5_analysis._write_fits_dataset(get_dataset, str(out_file))
+        dataset = SpectrumDatasetOnOff.read(out_file, name="64080")
+        assert dataset.name == "64080"
+        assert np.array_equal(dataset.counts.data, get_dataset.counts.data)
+        assert np.array_equal(dataset.counts_off.data, get_dataset.counts_off.data)
+        assert np.allclose(dataset.alpha.data, 0.2)
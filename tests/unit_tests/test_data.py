@@ -0,0 +1,69 @@
+import logging
+
+import astropy.units as u
+import numpy as np
+import pytest
+from astropy.time import Time
+from gammapy.data import GTI, Observation
+
+import v2dl5.data as v2dl5_data
+
+logger = logging.getLogger()
+logger.setLevel(logging.DEBUG)
+
+
+class DataStore:
+    # Data store returning new observations at each call (as gammapy.data.DataStore).
+    def __init__(self):
+        self.calls = 0
+
+    def get_observations(self, runs, required_irf=None, skip_missing=False):
+        self.calls += 1
+        return [
+            Observation(
+                obs_id=run,
+                gti=GTI.create([0 * u.s], [80 * u.s], reference_time=Time("2023-10-15T16:04")),
+            )
+            for run in runs
+        ]
+
+
+@pytest.fixture
+def get_args_dict(tmp_path, monkeypatch):
+    monkeypatch.setattr(v2dl5_data.DataStore, "from_dir", lambda _: DataStore())
+    (tmp_path / "run_list.txt").write_text("64080\n69976\n")
+    return {
+        "observations": {"datastore": tmp_path},
+        "run_list": tmp_path / "run_list.txt",
+        "bti": [{"run": 64080, "bti_start": 10, "bti_length": 10}],
+    }
+
+
+class TestGetObservations:
+    # Observations are read from the data store once.
+    def test_get_observations_cached(self, get_args_dict):
+        data = v2dl5_data.Data(get_args_dict)
+        observations = data.get_observations()
+        assert data.get_observations() is observations
+        assert [obs.obs_id for obs in observations] == [64080, 69976]
+        assert data.get_data_store().calls == 1
+
+    # Bad time intervals are removed from the GTIs of the observations used for data reduction.
+    @pytest.mark.parametrize("reflected_region", [True, False])
+    @pytest.mark.parametrize("skip_missing", [False, True])
+    def test_bti_applied_to_observations(self, get_args_dict, reflected_region, skip_missing):
+        data = v2dl5_data.Data(get_args_dict)
+        obs_bti, obs_no_bti = data.get_observations(
+            reflected_region=reflected_region, skip_missing=skip_missing
+        )
+        assert len(obs_bti.gti.table) == 2
+        assert np.allclose(obs_bti.gti.time_delta.to_value(u.s), [9.0, 59.0])
+        assert len(obs_no_bti.gti.table) == 1
+        assert obs_no_bti.gti.time_sum.to_value(u.s) == pytest.approx(80.0)
+
+    # Bad time intervals are applied once to each list of cached observations.
+    def test_bti_applied_once(self, get_args_dict):
+        data = v2dl5_data.Data(get_args_dict)
+        data.get_observations()
+        obs_bti, _ = data.get_observations()
+        assert np.allclose(obs_bti.gti.time_delta.to_value(u.s), [9.0, 59.0])
@@ -0,0 +1,48 @@
+import logging
+
+import matplotlib
+import matplotlib.pyplot as plt
+import pytest
+
+import v2dl5.plot as v2dl5_plot
+
+matplotlib.use("Agg")
+
+logger = logging.getLogger()
+logger.setLevel(logging.DEBUG)
+
+
+@pytest.fixture
+def get_shown(monkeypatch):
+    shown = []
+    monkeypatch.setattr(plt, "show", lambda: shown.append(plt.gcf()))
+    return shown
+
+
+class TestPlot:
+    # Plots on the reusable figure are written to the output directory.
+    def test_plot_reusable_figure(self, tmp_path, get_shown):
+        plotter = v2dl5_plot.Plot(None, None, output_dir=tmp_path)
+        ax = plotter._subplots()
+        assert ax.figure is plotter._figure
+        ax.plot([1, 2], [1, 2])
+        plotter._plot(plot_name="test", output_dir=tmp_path, figure=plotter._figure)
+        assert (tmp_path / "test.png").exists()
+        assert get_shown == []
+
+    # Plots are shown if no output directory is given.
+    def test_plot_no_output_dir(self, get_shown):
+        plotter = v2dl5_plot.Plot(None, None, output_dir=None)
+        ax = plotter._subplots()
+        ax.plot([1, 2], [1, 2])
+        plotter._plot(plot_name="test", output_dir=None, figure=plotter._figure)
+        assert get_shown == [ax.figure]
+
+    # Pyplot figures are used in interactive sessions.
+    def test_plot_interactive(self, tmp_path, get_shown):
+        plotter = v2dl5_plot.Plot(None, None, output_dir=tmp_path, interactive=True)
+        ax = plotter._subplots(figsize=(8, 6))
+        assert plotter._figure is None
+        ax.plot([1, 2], [1, 2])
+        plotter._plot(plot_name="test", output_dir=tmp_path, figure=plotter._figure)
+        assert (tmp_path / "test.png").exists()
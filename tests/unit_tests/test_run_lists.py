@@ -0,0 +1,246 @@
+import logging
+
+import numpy as np
+import pytest
+from astropy.coordinates import SkyCoord
+from astropy.table import Table
+
+import v2dl5.run_lists as run_lists
+
+logger = logging.getLogger()
+logger.setLevel(logging.DEBUG)
+
+
+@pytest.fixture
+def get_obs_table():
+    return Table(
+        {
+            "OBS_ID": [40000, 50000, 60000, 70000, 70001, 70002],
+            "RUNTYPE": [
+                "observing",
+                "observing",
+                "observing",
+                "observing",
+                "obsLowHV",
+                "observing",
+            ],
+            "N_TELS": [4, 3, 4, 4, 4, 2],
+            "ONTIME": [1200.0, 1800.0, 60.0, 1800.0, 1800.0, 1800.0],
+            "DQMSTAT": ["good_run", "good_run", "bad_run", "minor_problem", "unknown", "good_run"],
+            "WEATHER": ["A", "B-", "C", "A+", "D", "B"],
+            "L3RATE": [150.0, 250.0, 300.0, 350.0, 5.0, 400.0],
+        }
+    )
+
+
+@pytest.fixture
+def get_args_dict():
+    return {
+        "dqm": {
+            "dqmstat": ["good_run", "minor_problem"],
+            "ntel_min": 3,
+            "ontime_min": "5 min",
+            "l3_rate_min": {"V4": "200 Hz", "V6": "0.36 kHz"},
+        },
+        "atmosphere": {"weather": ["A", "B"]},
+        "observations": {"obs_cone_radius_min": "0.25 deg", "obs_cone_radius_max": "1.5 deg"},
+    }
+
+
+@pytest.fixture
+def get_cuts(get_args_dict):
+    return run_lists._selection_cuts(get_args_dict, None)
+
+
+class TestApplyCuts:
+    # Keep runs with at least ntel_min telescopes.
+    def test_cut_ntel_min(self, get_obs_table, get_cuts):
+        obs_table = run_lists._apply_cut_ntel_min(get_obs_table, get_cuts, None)
+        assert list(obs_table["OBS_ID"]) == [40000, 50000, 60000, 70000, 70001]
+
+    # Keep runs longer than the minimum ontime.
+    def test_cut_ontime_min(self, get_obs_table, get_cuts):
+        obs_table = run_lists._apply_cut_ontime_min(get_obs_table, get_cuts, None)
+        assert 60000 not in obs_table["OBS_ID"]
+        assert len(obs_table) == 5
+
+    # Keep runs with accepted dqm status.
+    def test_cut_dqm(self, get_obs_table, get_cuts):
+        obs_table = run_lists._apply_cut_dqm(get_obs_table, get_cuts, None)
+        assert list(obs_table["OBS_ID"]) == [40000, 50000, 70000, 70002]
+
+    # Keep runs with accepted weather (first character only).
+    def test_cut_atmosphere(self, get_obs_table, get_cuts):
+        obs_table = run_lists._apply_cut_atmosphere(get_obs_table, get_cuts, None)
+        assert list(obs_table["OBS_ID"]) == [40000, 50000, 70000, 70002]
+
+    # Empty weather entries raise an IndexError.
+    def test_cut_atmosphere_empty_weather(self, get_obs_table, get_cuts):
+        get_obs_table["WEATHER"][0] = ""
+        with pytest.raises(IndexError):
+            run_lists._apply_cut_atmosphere(get_obs_table, get_cuts, None)
+
+    # Bytes columns (as read from FITS files) are handled.
+    def test_cut_dqm_bytes_column(self, get_obs_table, get_cuts):
+        get_obs_table["DQMSTAT"] = np.char.encode(np.asarray(get_obs_table["DQMSTAT"]))
+        obs_table = run_lists._apply_cut_dqm(get_obs_table, get_cuts, None)
+        assert list(obs_table["OBS_ID"]) == [40000, 50000, 70000, 70002]
+
+    # Keep runs between minimum and maximum MJD.
+    def test_cut_mjd(self, get_obs_table, get_cuts):
+        get_obs_table["DATE-OBS"] = [f"2020-01-0{i + 1}T03:00:00" for i in range(6)]
+        get_obs_table["DATE-END"] = [f"2020-01-0{i + 1}T03:30:00" for i in range(6)]
+        get_cuts["mjd_min"] = 58850.0
+        get_cuts["mjd_max"] = 58853.0
+        obs_table = run_lists._apply_cut_mjd(get_obs_table, get_cuts)
+        assert list(obs_table["OBS_ID"]) == [50000, 60000, 70000]
+
+    # Runs are selected in a ring around the target.
+    def test_cut_target(self, get_obs_table, get_args_dict):
+        get_obs_table["RA_PNT"] = [83.6, 84.1, 83.6, 90.0, 83.6, 83.6]
+        get_obs_table["DEC_PNT"] = [22.0, 22.0, 22.5, 22.0, 23.0, 24.0]
+        target = SkyCoord(83.6, 22.0, unit="deg", frame="icrs")
+        cuts = run_lists._selection_cuts(get_args_dict, target)
+        obs_table = run_lists._apply_cut_target(get_obs_table, cuts, target)
+        assert list(obs_table["OBS_ID"]) == [50000, 60000, 70001]
+
+
+class TestSelectionCuts:
+    # Cut values are converted to plain numbers.
+    def test_selection_cuts(self, get_args_dict):
+        cuts = run_lists._selection_cuts(get_args_dict, None)
+        assert cuts["ontime_min"] == pytest.approx(300.0)
+        assert cuts["l3_rate_min"] == pytest.approx(
+            {"V4": 200.0, "V5": 0.0, "V6": 360.0, "V6_redHV": 0.0}
+        )
+        assert cuts["mjd_min"] is None
+        assert "obs_cone_radius_max" not in cuts
+
+    # Missing required cut values raise a KeyError.
+    def test_selection_cuts_missing_key(self, get_args_dict):
+        del get_args_dict["dqm"]["ntel_min"]
+        with pytest.raises(KeyError):
+            run_lists._selection_cuts(get_args_dict, None)
+
+
+class TestEpochMasks:
+    # Epochs are defined by run number and run type.
+    def test_epoch_masks(self, get_obs_table):
+        mask_V4, mask_V5, mask_V6, mask_V6_redHV = run_lists._epoch_masks(get_obs_table)
+        assert list(mask_V4) == [True, False, False, False, False, False]
+        assert list(mask_V5) == [False, True, True, False, False, False]
+        assert list(mask_V6) == [False, False, False, True, False, True]
+        assert list(mask_V6_redHV) == [False, False, False, False, True, False]
+
+    # Minimum L3 rate cut is applied per epoch.
+    def test_cut_l3rate(self, get_obs_table, get_cuts):
+        obs_table = run_lists._apply_cut_l3rate(get_obs_table, get_cuts, None)
+        assert list(obs_table["OBS_ID"]) == [50000, 60000, 70001, 70002]
+
+
+class TestOutliers:
+    # Outliers are defined by the deviation from the median.
+    def test_reject_outliers(self):
+        data = np.array([1.0, 2.0, 2.0, 3.0, 100.0])
+        inliers, outliers, median, mdev = run_lists._reject_outliers(data)
+        assert list(inliers) == [1.0, 2.0, 2.0, 3.0]
+        assert list(outliers) == [100.0]
+        assert median == 2.0
+        assert mdev == 1.0
+
+    # No outliers if the median absolute deviation is zero.
+    def test_reject_outliers_zero_deviation(self):
+        data = np.array([2.0, 2.0, 2.0, 5.0])
+        inliers, outliers, _, mdev = run_lists._reject_outliers(data)
+        assert mdev == 0.0
+        assert len(inliers) == 4
+        assert len(outliers) == 0
+
+    # Outlier masks for mean and median cuts.
+    def test_outlier_lists(self, get_obs_table):
+        m, s, mask = run_lists._outlier_lists(
+            get_obs_table, "test", "L3RATE", "Median", "bounds", sigma=3.0
+        )
+        assert m == 275.0
+        assert s == 100.0
+        assert not mask.any()
+        _, _, mask = run_lists._outlier_lists(
+            get_obs_table, "test", "L3RATE", "Mean", "min", sigma=1.0
+        )
+        assert list(get_obs_table["OBS_ID"][mask]) == [70001]
+        _, _, mask = run_lists._outlier_lists(
+            get_obs_table, "test", "L3RATE", "Median", "max", sigma=1.0
+        )
+        assert list(get_obs_table["OBS_ID"][mask]) == [70002]
+
+
+class TestReadObservationTable:
+    # Only required columns are read; masked dqm status is set to unknown
+    # (memory-mapped and compressed FITS files).
+    @pytest.mark.parametrize("suffix", [".fits", ".fits.gz"])
+    def test_read_observation_table(self, get_obs_table, tmp_path, suffix):
+        obs_table = Table(get_obs_table, masked=True)
+        obs_table["DQMSTAT"].mask[1] = True
+        obs_table["NOT_USED"] = np.zeros(len(obs_table))
+        obs_table.write(tmp_path / f"obs-index{suffix}")
+
+        obs_table = run_lists._read_observation_table(tmp_path / f"obs-index{suffix}")
+        assert "NOT_USED" not in obs_table.colnames
+        assert obs_table.colnames[0] == "OBS_ID"
+        assert obs_table["DQMSTAT"][1] == "unknown"
+        assert len(obs_table) == 6
+
+
+class TestWriteRunList:
+    # Run list is written sorted by OBS_ID, one run per line.
+    def test_write_run_list(self, get_obs_table, tmp_path):
+        get_obs_table.reverse()
+        run_lists._write_run_list(get_obs_table, tmp_path)
+        assert (tmp_path / "run_list.txt").read_text().split() == [
+            "40000",
+            "50000",
+            "60000",
+            "70000",
+            "70001",
+            "70002",
+        ]
+        assert len(Table.read(tmp_path / "run_list.fits.gz")) == 6
+
+    # Run table written with fitsio keeps columns, rows, and units.
+    def test_write_run_list_fitsio(self, get_obs_table, tmp_path):
+        pytest.importorskip("fitsio")
+        get_obs_table["ONTIME"].unit = "s"
+        run_lists._write_run_list(get_obs_table, tmp_path, use_fitsio=True)
+        run_table = Table.read(tmp_path / "run_list.fits.gz")
+        assert run_table.colnames == get_obs_table.colnames
+        assert list(run_table["OBS_ID"]) == list(get_obs_table["OBS_ID"])
+        assert list(run_table["DQMSTAT"]) == list(get_obs_table["DQMSTAT"])
+        assert np.allclose(run_table["L3RATE"], get_obs_table["L3RATE"])
+        assert run_table["ONTIME"].unit == "s"
+
+
+class TestGenerateRunList:
+    # Run table of selected runs keeps all columns of the observation table.
+    @pytest.mark.parametrize("suffix", [".fits", ".fits.gz"])
+    def test_generate_run_list(self, get_obs_table, get_args_dict, tmp_path, monkeypatch, suffix):
+        n_runs = len(get_obs_table)
+        get_obs_table["DATE-OBS"] = ["2020-01-01T03:00:00"] * n_runs
+        get_obs_table["DATE-END"] = ["2020-01-01T03:30:00"] * n_runs
+        get_obs_table["RA_PNT"] = get_obs_table["RA_OBJ"] = [83.6] * n_runs
+        get_obs_table["DEC_PNT"] = [22.5] * n_runs
+        get_obs_table["DEC_OBJ"] = [22.0] * n_runs
+        get_obs_table["L3RATESD"] = [5.0] * n_runs
+        for column in ("FIRMEAN1", "FIRCORM1", "FIRSTD1"):
+            get_obs_table[column] = [-30.0] * n_runs
+        get_obs_table["ZEN_PNT"] = [20.0, 21.0, 22.0, 23.0, 24.0, 25.0]
+        get_obs_table.write(tmp_path / f"obs-index{suffix}")
+
+        get_args_dict["obs_table"] = tmp_path / f"obs-index{suffix}"
+        get_args_dict["output_dir"] = tmp_path
+        monkeypatch.setattr(run_lists, "_dqm_report", lambda *args, **kwargs: None)
+        run_lists.generate_run_list(get_args_dict, SkyCoord(83.6, 22.0, unit="deg"))
+
+        run_table = Table.read(tmp_path / "run_list.fits.gz")
+        assert list(run_table["OBS_ID"]) == [50000]
+        assert list(run_table["ZEN_PNT"]) == [21.0]
+        assert (tmp_path / "run_list.txt").read_text().split() == ["50000"]
@@ -0,0 +1,265 @@
+import logging
+import subprocess
+import sys
+
+import astropy.units as u
+import numpy as np
+import pytest
+from astropy.coordinates import Angle, SkyCoord, name_resolve
+
+import v2dl5.sky_regions as sky_regions
+
+logger = logging.getLogger()
+logger.setLevel(logging.DEBUG)
+
+
+@pytest.fixture
+def get_args_dict():
+    return {
+        "on_region": {
+            "target": "Crab",
+            "frame": "icrs",
+            "lon": "83.633 deg",
+            "lat": "22.014 deg",
+            "radius": "0.1 deg",
+        },
+        "datasets": {
+            "exclusion_region": {
+                "on_radius": "0.5 deg",
+                "magnitude_B": 7,
+                "star_exclusion_radius": "0.3 deg",
+                "fov": "3.5 deg",
+                "star_file": "hip_mag9.fits.gz",
+            }
+        },
+    }
+
+
+class TestGetTarget:
+    # Targets given by name are resolved once.
+    def test_get_target_cached(self, get_args_dict, monkeypatch):
+        calls = []
+
+        def from_name(name):
+            calls.append(name)
+            return SkyCoord(83.633, 22.014, unit=u.deg)
+
+        monkeypatch.setattr(SkyCoord, "from_name", from_name)
+        sky_regions._resolve_name.cache_clear()
+        get_args_dict["on_region"] = {"target": "Crab", "radius": "0.1 deg"}
+        regions = sky_regions.SkyRegions(args_dict=get_args_dict)
+        assert regions.get_target(sky_coord=get_args_dict["on_region"]) is regions.target
+        assert regions.on_region.center is regions.target
+        assert calls == ["Crab"]
+        sky_regions.SkyRegions(args_dict=get_args_dict)
+        assert calls == ["Crab"]
+
+    # Names which cannot be resolved are not queried again.
+    def test_get_target_not_found(self, get_args_dict, monkeypatch):
+        calls = []
+
+        def from_name(name):
+            calls.append(name)
+            raise name_resolve.NameResolveError(f"Unable to find coordinates for name '{name}'")
+
+        monkeypatch.setattr(SkyCoord, "from_name", from_name)
+        sky_regions._resolve_name.cache_clear()
+        get_args_dict["on_region"] = {"target": "not a target", "radius": "0.1 deg"}
+        for _ in range(2):
+            with pytest.raises(name_resolve.NameResolveError):
+                sky_regions.SkyRegions(args_dict=get_args_dict)
+        assert calls == ["not a target"]
+
+    # Failed queries (e.g., network errors) are not cached.
+    def test_get_target_transient_failure(self, get_args_dict, monkeypatch):
+        calls = []
+
+        def from_name(name):
+            calls.append(name)
+            if len(calls) == 1:
+                raise name_resolve.NameResolveError(
+                    "All Sesame queries failed. Unable to retrieve coordinates."
+                )
+            return SkyCoord(83.633, 22.014, unit=u.deg)
+
+        monkeypatch.setattr(SkyCoord, "from_name", from_name)
+        sky_regions._resolve_name.cache_clear()
+        get_args_dict["on_region"] = {"target": "Crab", "radius": "0.1 deg"}
+        with pytest.raises(name_resolve.NameResolveError):
+            sky_regions.SkyRegions(args_dict=get_args_dict)
+        regions = sky_regions.SkyRegions(args_dict=get_args_dict)
+        assert regions.target.ra.deg == pytest.approx(83.633)
+        assert sky_regions.SkyRegions.resolve_names(["Crab"])["Crab"] is regions.target
+        assert calls == ["Crab", "Crab"]
+
+    # Names are resolved once, also when given multiple times.
+    def test_resolve_names(self, monkeypatch):
+        calls = []
+
+        def from_name(name):
+            calls.append(name)
+            return SkyCoord(83.633, 22.014, unit=u.deg)
+
+        monkeypatch.setattr(SkyCoord, "from_name", from_name)
+        sky_regions._resolve_name.cache_clear()
+        targets = sky_regions.SkyRegions.resolve_names(["Crab", "Mrk 421", "Crab"])
+        assert list(targets) == ["Crab", "Mrk 421"]
+        assert sorted(calls) == ["Crab", "Mrk 421"]
+        sky_regions.SkyRegions.resolve_names(["Mrk 421"])
+        assert len(calls) == 2
+
+
+class TestOnRegion:
+    # On region radius is converted to an Angle once.
+    def test_define_on_region(self, get_args_dict):
+        regions = sky_regions.SkyRegions(args_dict=get_args_dict)
+        assert regions.on_region.radius == Angle("0.1 deg")
+        radius = Angle("0.2 deg")
+        get_args_dict["on_region"]["radius"] = radius
+        assert regions.define_on_region(on_region_dict=get_args_dict["on_region"]).radius is radius
+
+
+class TestBoundingBox:
+    # Bounding box contains all directions within the radius (including RA wrap and poles).
+    @pytest.mark.parametrize("lon, lat", [(83.633, 22.014), (359.9, -30.0), (10.0, 88.0)])
+    def test_bounding_box_mask(self, get_args_dict, lon, lat):
+        get_args_dict["on_region"]["lon"] = f"{lon} deg"
+        get_args_dict["on_region"]["lat"] = f"{lat} deg"
+        regions = sky_regions.SkyRegions(args_dict=get_args_dict)
+        rng = np.random.default_rng(0)
+        ra = rng.uniform(0.0, 360.0, 100000)
+        dec = np.rad2deg(np.arcsin(rng.uniform(-1.0, 1.0, 100000)))
+        inside = regions.target.separation(SkyCoord(ra, dec, unit=u.deg)).deg < 3.5
+        box = regions._bounding_box_mask(ra, dec, 3.5)
+        assert inside.sum() > 0
+        assert np.all(box[inside])
+        assert box.sum() < len(ra)
+
+
+class TestBrightStarCatalogue:
+    # Stars within the maximum wobble distance and brighter than the magnitude cut are selected.
+    def test_read_bright_star_catalogue(self, get_args_dict):
+        regions = sky_regions.SkyRegions(args_dict=get_args_dict)
+        exclusion_regions = regions._read_bright_star_catalogue(
+            exclusion_region_dict=get_args_dict["datasets"]["exclusion_region"],
+            max_wobble_distance=3.5 * u.deg,
+        )
+        assert len(exclusion_regions) > 0
+        for region in exclusion_regions:
+            assert region.center.separation(regions.target) < 3.5 * u.deg
+            assert region.radius == 0.3 * u.deg
+
+    # Stars are returned as arrays of coordinates and radii.
+    def test_read_bright_star_catalogue_as_arrays(self, get_args_dict):
+        regions = sky_regions.SkyRegions(args_dict=get_args_dict)
+        exclusion_regions = regions._read_bright_star_catalogue(
+            exclusion_region_dict=get_args_dict["datasets"]["exclusion_region"],
+            max_wobble_distance=3.5 * u.deg,
+        )
+        ra, dec, radius = regions._read_bright_star_catalogue(
+            exclusion_region_dict=get_args_dict["datasets"]["exclusion_region"],
+            max_wobble_distance=3.5 * u.deg,
+            as_arrays=True,
+        )
+        assert np.allclose(ra, [region.center.ra.deg for region in exclusion_regions])
+        assert np.allclose(dec, [region.center.dec.deg for region in exclusion_regions])
+        assert np.allclose(radius, 0.3)
+
+    # No exclusion regions without star file.
+    def test_no_star_file(self, get_args_dict):
+        get_args_dict["datasets"]["exclusion_region"]["star_file"] = None
+        regions = sky_regions.SkyRegions(args_dict=get_args_dict)
+        assert (
+            regions._read_bright_star_catalogue(
+                exclusion_region_dict=get_args_dict["datasets"]["exclusion_region"],
+                max_wobble_distance=3.5 * u.deg,
+            )
+            == []
+        )
+
+
+class TestExclusionMask:
+    # On region and bright stars are excluded.
+    def test_get_exclusion_mask(self, get_args_dict):
+        regions = sky_regions.SkyRegions(args_dict=get_args_dict)
+        exclusion_mask = regions.get_exclusion_mask(get_args_dict, max_wobble_distance=3.5 * u.deg)
+        assert exclusion_mask.data.shape == (150, 150)
+        assert not exclusion_mask.data[75, 75]
+        assert exclusion_mask.data[0, 0]
+
+    # Exclusion mask is recomputed only for changed parameters.
+    def test_get_exclusion_mask_cached(self, get_args_dict):
+        regions = sky_regions.SkyRegions(args_dict=get_args_dict)
+        exclusion_mask = regions.get_exclusion_mask(get_args_dict, max_wobble_distance=3.5 * u.deg)
+        assert (
+            regions.get_exclusion_mask(get_args_dict, max_wobble_distance=3.5 * u.deg)
+            is exclusion_mask
+        )
+        get_args_dict["datasets"]["exclusion_region"]["on_radius"] = "0.7 deg"
+        updated_mask = regions.get_exclusion_mask(get_args_dict, max_wobble_distance=3.5 * u.deg)
+        assert updated_mask is not exclusion_mask
+        assert updated_mask.data.sum() < exclusion_mask.data.sum()
+
+    # Nothing is excluded without on region exclusion and star file.
+    def test_get_exclusion_mask_no_regions(self, get_args_dict):
+        get_args_dict["datasets"]["exclusion_region"]["on_radius"] = None
+        get_args_dict["datasets"]["exclusion_region"]["star_file"] = None
+        regions = sky_regions.SkyRegions(args_dict=get_args_dict)
+        exclusion_mask = regions.get_exclusion_mask(get_args_dict, max_wobble_distance=3.5 * u.deg)
+        assert exclusion_mask.data.shape == (150, 150)
+        assert exclusion_mask.data.all()
+
+    # Geometries are reused for unchanged target and parameters.
+    def test_get_geom_cached(self, get_args_dict):
+        regions = sky_regions.SkyRegions(args_dict=get_args_dict)
+        geom = regions._get_geom(npix=(150, 150), binsz=0.05, proj="TAN", frame="icrs")
+        assert regions._get_geom(npix=(150, 150), binsz=0.05, proj="TAN", frame="icrs") is geom
+        assert regions._get_geom(npix=(100, 100), binsz=0.05, proj="TAN", frame="icrs") is not geom
+
+    # Mask agrees with astropy angular separations (NumPy and numba implementation).
+    @pytest.mark.parametrize("implementation", ["numpy", "numba"])
+    def test_fill_exclusion_mask(self, implementation):
+        if implementation == "numba":
+            pytest.importorskip("numba")
+        fill_exclusion_mask = getattr(sky_regions, f"_fill_exclusion_mask_{implementation}")
+        rng = np.random.default_rng(1)
+        ra = rng.uniform(80.0, 88.0, 10000)
+        dec = rng.uniform(18.0, 26.0, 10000)
+        centers = SkyCoord([83.633, 85.0], [22.014, 20.0], unit=u.deg)
+        radius = np.array([0.5, 1.0])
+        mask = np.zeros(len(ra), dtype=bool)
+        fill_exclusion_mask(
+            np.deg2rad(ra).astype(np.float32),
+            np.deg2rad(dec).astype(np.float32),
+            centers.ra.rad.astype(np.float32),
+            centers.dec.rad.astype(np.float32),
+            (np.sin(0.5 * np.deg2rad(radius)) ** 2).astype(np.float32),
+            mask,
+        )
+        coords = SkyCoord(ra, dec, unit=u.deg)
+        expected = (coords.separation(centers[0]).deg < 0.5) | (
+            coords.separation(centers[1]).deg < 1.0
+        )
+        assert np.array_equal(mask, expected)
+
+    # Numba kernel is used for large problem sizes only.
+    @pytest.mark.parametrize("min_pairs, expected", [(0, "numba"), (10**12, "numpy")])
+    def test_fill_exclusion_mask_dispatch(self, monkeypatch, min_pairs, expected):
+        calls = []
+        for implementation in ("numpy", "numba"):
+            monkeypatch.setattr(
+                sky_regions,
+                f"_fill_exclusion_mask_{implementation}",
+                lambda *args, name=implementation: calls.append(name),
+            )
+        monkeypatch.setattr(sky_regions, "_NUMBA_MIN_PAIRS", min_pairs)
+        values = np.zeros(10, dtype=np.float32)
+        sky_regions._fill_exclusion_mask(
+            values, values, values, values, values, np.zeros(10, dtype=bool)
+        )
+        assert calls == [expected]
+
+    # numba is imported only when the kernel is needed.
+    def test_numba_not_imported_at_load(self):
+        code = "import sys, v2dl5.sky_regions; assert 'numba' not in sys.modules"
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,6 +1,10 @@
 """"Main analysis class."""
 
+import gzip
+import io
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import astropy.units as u
@@ -24,6 +28,11 @@ from gammapy.modeling.models import (
 import v2dl5.plot as v2dl5_plot
 import v2dl5.time as v2dl5_time
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 
 class Analysis:
     """
@@ -85,6 +94,7 @@ class Analysis:
             data_set=self.datasets,
             on_region=self.sky_regions.on_region,
             output_dir=_plot_dir,
+            interactive=self.args_dict.get("interactive", False),
         )
         plotter.plot_event_histograms()
         plotter.plot_irfs()
@@ -103,7 +113,9 @@ class Analysis:
         """Write results to files."""
 
         for dataset in self.datasets:
-            self._write_datasets(dataset, f"{dataset.name}.fits.gz")
+            _out_file = f"{self._output_dir}/data/{dataset.name}.fits.gz"
+            self._logger.info(f"Writing dataset to {_out_file}")
+            _write_fits_dataset(dataset, _out_file)
         self._write_datasets(self.flux_points, "flux_points.ecsv", "gadf-sed")
         for _, light_curve in self.light_curves.items():
             title_with_underscores = light_curve["title"].replace(" ", "_")
@@ -162,7 +174,7 @@ class Analysis:
         _out_file = f"{_data_dir}/{filename}"
         self._logger.info("Writing dataset to %s", _out_file)
         with open(_out_file, "w", encoding="utf-8") as outfile:
-            yaml.dump(data_dict, outfile, default_flow_style=False)
+            yaml.dump(data_dict, outfile, Dumper=_YamlDumper, default_flow_style=False)
 
     def _data_reduction(self):
         """
@@ -175,8 +187,6 @@ class Analysis:
 
         geom = RegionGeom.create(region=self.sky_regions.on_region, axes=[energy_axis])
 
-        dataset_empty = SpectrumDataset.create(geom=geom, energy_axis_true=energy_axis_true)
-
         dataset_maker = SpectrumDatasetMaker(
             containment_correction=False, selection=["counts", "exposure", "edisp"]
         )
@@ -191,13 +201,24 @@ class Analysis:
             safe_mask_masker.aeff_percent,
         )
 
-        self.datasets = Datasets()
-
-        for obs_id, observation in zip(self.v2dl5_data.runs, self.v2dl5_data.get_observations()):
-            dataset = dataset_maker.run(dataset_empty.copy(name=str(obs_id)), observation)
-            dataset_on_off = bkg_maker.run(dataset, observation)
-            dataset_on_off = safe_mask_masker.run(dataset_on_off, observation)
-            self.datasets.append(dataset_on_off)
+        _reduce = partial(
+            _reduce_observation,
+            geom=geom,
+            energy_axis_true=energy_axis_true,
+            dataset_maker=dataset_maker,
+            bkg_maker=bkg_maker,
+            safe_mask_masker=safe_mask_masker,
+        )
+        _runs = self.v2dl5_data.runs
+        _observations = self.v2dl5_data.get_observations()
+
+        n_workers = self.args_dict["datasets"].get("n_workers", 1)
+        if n_workers > 1:
+            self._logger.info("Data reduction using %d processes", n_workers)
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                self.datasets = Datasets(list(executor.map(_reduce, _runs, _observations)))
+        else:
+            self.datasets = Datasets(list(map(_reduce, _runs, _observations)))
 
         self._logger.info("Run-wise results:")
         self._print_results(self.datasets.info_table(cumulative=False))
@@ -215,23 +236,22 @@ class Analysis:
 
         """
 
-        for col in info_table.colnames:
-            if info_table[col].dtype.kind == "f":
-                info_table[col].format = "{:.2f}"
-
-        print(
-            info_table[
-                "name",
-                "livetime",
-                "ontime",
-                "counts",
-                "counts_off",
-                "background",
-                "alpha",
-                "excess",
-                "sqrt_ts",
-            ]
-        )
+        _table = info_table[
+            "name",
+            "livetime",
+            "ontime",
+            "counts",
+            "counts_off",
+            "background",
+            "alpha",
+            "excess",
+            "sqrt_ts",
+        ]
+        for col in _table.itercols():
+            if col.dtype.kind == "f":
+                col.info.format = "{:.2f}"
+
+        print(_table)
         print()
 
     def _spectral_fits(self, datasets=None):
@@ -291,10 +311,12 @@ class Analysis:
         fpe = FluxPointsEstimator(energy_edges=energy_edges, selection_optional="all")
         self.flux_points = fpe.run(datasets=datasets)
 
-        self.flux_points.to_table(sed_type="dnde", formatted=True).pprint()
-        self.flux_points.to_table(sed_type="dnde", formatted=True).pprint_all()
-        self.flux_points.to_table(sed_type="e2dnde", formatted=True).pprint()
-        self.flux_points.to_table(sed_type="e2dnde", formatted=True).pprint_all()
+        for sed_type in ("dnde", "e2dnde"):
+            _table = self.flux_points.to_table(sed_type=sed_type, formatted=True)
+            if self.args_dict.get("interactive", False):
+                _table.pprint_all()
+            else:
+                _table.pprint()
 
     def _analyse_light_curves(self, data_sets):
         """
@@ -390,7 +412,8 @@ class Analysis:
                 "sqrt_ts",
             ]
         )
-        _table.pprint_all()
+        if self.args_dict.get("interactive", False):
+            _table.pprint_all()
 
         return _light_curve
 
@@ -410,3 +433,71 @@ class Analysis:
             unit="TeV",
             name=name,
         )
+
+
+def _reduce_observation(
+    obs_id, observation, geom, energy_axis_true, dataset_maker, bkg_maker, safe_mask_masker
+):
+    """
+    Reduce a single observation to a spectrum on-off dataset.
+
+    Module-level function to allow execution in worker processes.
+
+    Parameters
+    ----------
+    obs_id : int
+        Observation ID (used as dataset name).
+    observation : Observation
+        Observation
+    geom : RegionGeom
+        On region geometry (reconstructed energy)
+    energy_axis_true : MapAxis
+        True energy axis
+    dataset_maker : SpectrumDatasetMaker
+        Dataset maker
+    bkg_maker : ReflectedRegionsBackgroundMaker
+        Background maker
+    safe_mask_masker : SafeMaskMaker
+        Safe mask maker
+
+    Returns
+    -------
+    SpectrumDatasetOnOff
+        Reduced dataset.
+
+    """
+
+    # reference dataset defines geometry and name only (maker allocates all maps)
+    dataset_empty = SpectrumDataset.create(
+        geom=geom, energy_axis_true=energy_axis_true, name=str(obs_id)
+    )
+    dataset = dataset_maker.run(dataset_empty, observation)
+    dataset_on_off = bkg_maker.run(dataset, observation)
+    return safe_mask_masker.run(dataset_on_off, observation)
+
+
+def _write_fits_dataset(dataset, out_file):
+    """
+    Write dataset to FITS file.
+
+    HDUs are serialized (and compressed for .gz files) in memory and written
+    to disk in a single write to reduce file-system operations.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        Dataset
+    out_file : str
+        Output file name
+
+    """
+
+    _buffer = io.BytesIO()
+    dataset.to_hdulist().writeto(_buffer)
+    _data = _buffer.getvalue()
+    if str(out_file).endswith(".gz"):
+        _data = gzip.compress(_data)
+
+    _out_path = Path(out_file)
+    _out_path.parent.mkdir(parents=True, exist_ok=True)
+    _out_path.write_bytes(_data)
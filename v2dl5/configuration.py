@@ -139,6 +139,7 @@ def _default_config_analysis():
                 "parameters": {"aeff_percent": 0.1},
             },
             "background": {"method": "reflected"},
+            "n_workers": 1,
         },
         "fit": {"fit_range": {"min": "0.1 TeV", "max": "20 TeV"}, "model": "pl"},
         "flux_points": {"energy": {"min": "0.1 TeV", "max": "20 TeV", "nbins": 10}, "source": None},
@@ -147,6 +148,7 @@ def _default_config_analysis():
             "time_zone": -7,
             "time_bin_files": [],
         },
+        "interactive": False,
     }
 
 
@@ -172,4 +174,6 @@ def _default_config_dqm_run_list():
             "ontime_min": "5 min",
         },
         "atmosphere": {"weather": ["A", "B"]},
+        "use_fitsio": False,
+        "print_run_tables": True,
     }
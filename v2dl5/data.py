@@ -46,6 +46,7 @@ class Data:
             "Initializing data object from %s", args_dict["observations"]["datastore"]
         )
         self._data_store = DataStore.from_dir(args_dict["observations"]["datastore"])
+        self._observations = {}
         self.target = target
         if args_dict.get("run_list") is None:
             self.runs = self._from_target(
@@ -53,7 +54,7 @@ class Data:
             )
         else:
             self.runs = self._from_run_list(args_dict.get("run_list"))
-        self._update_gti(args_dict.get("bti", None))
+        self._bti = args_dict.get("bti", None)
 
     def get_data_store(self):
         """
@@ -67,6 +68,9 @@ class Data:
         """
         Return list of observations.
 
+        Observations are read from the data store at the first call and cached.
+        GTIs are updated for bad time intervals when observations are read.
+
         Parameters
         ----------
         reflected_region : bool
@@ -84,11 +88,15 @@ class Data:
         required_irf = "full-enclosure"
         if reflected_region:
             required_irf = "point-like"
-        return self._data_store.get_observations(
-            self.runs,
-            required_irf=required_irf,
-            skip_missing=skip_missing,
-        )
+        _key = (required_irf, skip_missing)
+        if _key not in self._observations:
+            self._observations[_key] = self._data_store.get_observations(
+                self.runs,
+                required_irf=required_irf,
+                skip_missing=skip_missing,
+            )
+            self._update_gti(self._observations[_key], self._bti)
+        return self._observations[_key]
 
     def _from_run_list(self, run_list):
         """
@@ -188,12 +196,14 @@ class Data:
         )
         return np.max(woff) * u.deg + fov / 2.0
 
-    def _update_gti(self, bti):
+    def _update_gti(self, observations, bti):
         """
         Update good time intervals by removing bad time intervals.
 
         Parameters
         ----------
+        observations : list of `~gammapy.data.Observation`
+            List of observations.
         bti : list of dict
             List of bad time intervals
             Given us {"run": run, "bti_start": start, "bti_length": length}
@@ -203,15 +213,14 @@ class Data:
         if bti is None:
             return
 
-        for obs in self.get_observations():
+        for obs in observations:
             bti_pairs = [
                 (item["bti_start"], item["bti_start"] + item["bti_length"])
                 for item in bti
                 if item["run"] == obs.obs_id
             ]
             if len(bti_pairs) == 0:
-                self._logger.debug("No BTI found for {obs.obs_id}")
+                self._logger.debug("No BTI found for %s", obs.obs_id)
                 continue
-            self._logger.debug("Updating GTI for {obs.obs_id} with {bti_pairs}")
-            obs.gti.stack(other=BTI.BTI(obs).update_gti(bti_pairs))
-            obs.gti.union()
+            self._logger.debug("Updating GTI for %s with %s", obs.obs_id, bti_pairs)
+            obs.gti.table = BTI.BTI(obs).update_gti(bti_pairs).table
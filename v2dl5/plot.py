@@ -15,6 +15,8 @@ from gammapy.visualization import (
     plot_spectrum_datasets_off_regions,
     plot_theta_squared_table,
 )
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
@@ -25,7 +27,7 @@ class Plot:
 
     """
 
-    def __init__(self, v2dl5_data, data_set, on_region=None, output_dir=None):
+    def __init__(self, v2dl5_data, data_set, on_region=None, output_dir=None, interactive=False):
         self._logger = logging.getLogger(__name__)
 
         self.v2dl5_data = v2dl5_data
@@ -33,6 +35,13 @@ class Plot:
         self.on_region = on_region
         self.output_dir = output_dir
 
+        # reusable figure for plots with a fixed axes layout (not managed by pyplot);
+        # pyplot figures are used for interactive sessions or without output directory
+        self._figure = None
+        if not interactive and output_dir is not None:
+            self._figure = Figure()
+            FigureCanvasAgg(self._figure)
+
     def default_offsets(self):
         """
         List of default offsets
@@ -112,7 +121,7 @@ class Plot:
         """
 
         info_table = self.data_set.info_table(cumulative=True)
-        _, (ax_excess, ax_sqrt_ts) = plt.subplots(figsize=(10, 4), ncols=2, nrows=1)
+        ax_excess, ax_sqrt_ts = self._subplots(figsize=(10, 4), ncols=2, nrows=1)
         ax_excess.plot(
             info_table["livetime"].to("h"),
             info_table["excess"],
@@ -138,6 +147,7 @@ class Plot:
             self._plot(
                 plot_name="source_statistics",
                 output_dir=self.output_dir,
+                figure=self._figure,
             )
         except TypeError:
             pass
@@ -178,10 +188,10 @@ class Plot:
 
         """
 
-        _, ax = plt.subplots()
+        ax = self._subplots()
         flux_point_dataset.plot(ax=ax, sed_type="dnde", color="darkorange")
         flux_point_dataset.plot_ts_profiles(ax=ax, sed_type="dnde")
-        self._plot(plot_name="flux_points", output_dir=self.output_dir)
+        self._plot(plot_name="flux_points", output_dir=self.output_dir, figure=self._figure)
 
     def plot_sed(self, flux_point_dataset):
         """
@@ -205,7 +215,7 @@ class Plot:
 
         """
 
-        _, ax = plt.subplots(
+        ax = self._subplots(
             figsize=(8, 6),
             gridspec_kw={"left": 0.16, "bottom": 0.2, "top": 0.98, "right": 0.98},
         )
@@ -214,7 +224,9 @@ class Plot:
             light_curve.plot(ax=ax, marker="o", label=plot_name, sed_type="flux", time_format="mjd")
             ax.set_yscale("linear")
             self._plot(
-                plot_name="light_curve_" + plot_name.replace(" ", "_"), output_dir=self.output_dir
+                plot_name="light_curve_" + plot_name.replace(" ", "_"),
+                output_dir=self.output_dir,
+                figure=self._figure,
             )
         except AttributeError:
             pass
@@ -255,11 +267,46 @@ class Plot:
         except AttributeError:
             pass
 
-    def _plot(self, plot_name=None, output_dir=None):
+    def _subplots(self, figsize=(6.4, 4.8), **kwargs):
+        """
+        Clear the reusable figure and add new axes (new pyplot figure if there is
+        no reusable figure).
+
+        Parameters
+        ----------
+        figsize : tuple
+            Figure size in inches.
+        kwargs : dict
+            Forwarded to `~matplotlib.figure.Figure.subplots`.
+
+        Returns
+        -------
+        axes : `~matplotlib.axes.Axes` or array of Axes
+            New axes.
+
+        """
+
+        if self._figure is None:
+            _, axes = plt.subplots(figsize=figsize, **kwargs)
+            return axes
+        self._figure.clear()
+        self._figure.set_size_inches(figsize)
+        return self._figure.subplots(**kwargs)
+
+    def _plot(self, plot_name=None, output_dir=None, figure=None):
         """
         Plotting helper function
 
+        Plots on the reusable figure (figure is not None) are written to file only;
+        all other plots are shown if no output directory is given.
+
         """
+        if figure is not None:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            _ofile = f"{output_dir}/{plot_name}.png"
+            self._logger.info("Plotting %s", _ofile)
+            figure.savefig(_ofile)
+            return
         if output_dir is not None:
             output_dir.mkdir(parents=True, exist_ok=True)
             _ofile = f"{output_dir}/{plot_name}.png"
@@ -275,16 +322,17 @@ class Plot:
 
         """
 
-        _, axes = plt.subplots(nrows=1, ncols=3, figsize=(15, 5))
+        axes = self._subplots(nrows=1, ncols=3, figsize=(15, 5))
         obs.aeff.plot(ax=axes[2])
         obs.aeff.plot_energy_dependence(ax=axes[0], offset=self.default_offsets())
         obs.aeff.plot_offset_dependence(ax=axes[1], energy=self.default_energy_true())
-        plt.tight_layout()
+        axes[0].figure.tight_layout()
 
         try:
             self._plot(
                 plot_name=f"aeff_obs_{obs.obs_id}",
                 output_dir=self.output_dir / "irfs",
+                figure=self._figure,
             )
         except TypeError:
             pass
@@ -295,7 +343,7 @@ class Plot:
 
         """
 
-        _, axes = plt.subplots(nrows=1, ncols=3, figsize=(15, 5))
+        axes = self._subplots(nrows=1, ncols=3, figsize=(15, 5))
         obs.edisp.plot_bias(
             ax=axes[0],
             offset=self.default_offsets()[0],
@@ -309,12 +357,13 @@ class Plot:
         _edisp = obs.edisp.to_edisp_kernel(offset=self.default_offsets()[0])
         _edisp.plot_matrix(ax=axes[2])
 
-        plt.tight_layout()
+        axes[0].figure.tight_layout()
 
         try:
             self._plot(
                 plot_name=f"edisp_obs_{obs.obs_id}",
                 output_dir=self.output_dir / "irfs",
+                figure=self._figure,
             )
         except TypeError:
             pass
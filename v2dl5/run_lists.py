@@ -4,8 +4,9 @@ Run list selection from observation table.
 """
 
 import logging
+import sys
+from pathlib import Path
 
-import astropy.io
 import astropy.table
 import astropy.units as u
 import matplotlib.pyplot as plt
@@ -15,6 +16,29 @@ from astropy.time import Time
 
 _logger = logging.getLogger(__name__)
 
+# observation table columns used for run selection and dqm reporting
+_OBS_TABLE_COLUMNS = [
+    "OBS_ID",
+    "DATE-OBS",
+    "DATE-END",
+    "RUNTYPE",
+    "DATACAT",
+    "ONTIME",
+    "RA_PNT",
+    "DEC_PNT",
+    "RA_OBJ",
+    "DEC_OBJ",
+    "N_TELS",
+    "TELLIST",
+    "DQMSTAT",
+    "WEATHER",
+    "L3RATE",
+    "L3RATESD",
+    "FIRMEAN1",
+    "FIRCORM1",
+    "FIRSTD1",
+]
+
 
 def generate_run_list(args_dict, target):
     """
@@ -25,11 +49,20 @@ def generate_run_list(args_dict, target):
     calculate_averages(args_dict)
 
     _logger.info("Generate run list. from %s", args_dict["obs_table"])
-    obs_table = _read_observation_table(args_dict["obs_table"])
+    run_table = _open_observation_table(args_dict["obs_table"])
+    obs_table = _fill_masked_values(_used_columns(run_table))
     obs_table = _apply_selection_cuts(obs_table, args_dict, target)
     _logger.info("Selected %d runs.", len(obs_table))
-    _dqm_report(obs_table, args_dict["output_dir"])
-    _write_run_list(obs_table, args_dict["output_dir"])
+    obs_table.sort("OBS_ID")
+    _dqm_report(
+        obs_table, args_dict["output_dir"], print_tables=args_dict.get("print_run_tables", True)
+    )
+    # run table with all columns of the observation table (selected rows only)
+    run_table = _fill_masked_values(run_table[np.isin(run_table["OBS_ID"], obs_table["OBS_ID"])])
+    run_table.sort("OBS_ID")
+    _write_run_list(
+        run_table, args_dict["output_dir"], use_fitsio=args_dict.get("use_fitsio", False)
+    )
 
 
 def calculate_averages(args_dict):
@@ -52,15 +85,52 @@ def _read_observation_table(obs_table_file_name):
     """
     Read observation table from obs_index file.
 
+    Only the columns required for run selection and reporting are kept
+    (see _OBS_TABLE_COLUMNS); masked values are filled with default values.
+
+    """
+
+    return _fill_masked_values(_used_columns(_open_observation_table(obs_table_file_name)))
+
+
+def _open_observation_table(obs_table_file_name):
+    """
+    Open observation table from obs_index file.
+
+    Uncompressed FITS files are memory mapped; no data is copied before columns
+    or rows are selected from the returned table.
+
+    """
+
+    if Path(obs_table_file_name).suffix == ".fits":
+        return astropy.table.Table.read(obs_table_file_name, memmap=True)
+    return astropy.table.Table.read(obs_table_file_name)
+
+
+def _fill_masked_values(obs_table):
+    """
     Fill masked values for the following fields with default values:
 
     - DQMSTAT: "unknown"
 
     """
 
-    obs_table = astropy.table.Table.read(obs_table_file_name)
-    obs_table["DQMSTAT"].fill_value = "unknown"
-    return obs_table.filled()
+    if isinstance(obs_table["DQMSTAT"], astropy.table.MaskedColumn):
+        obs_table["DQMSTAT"].fill_value = "unknown"
+    obs_table = obs_table.filled()
+    # empty strings are not masked when reading memory-mapped FITS files
+    _dqm_stat = _string_column(obs_table, "DQMSTAT")
+    obs_table["DQMSTAT"] = np.where(_dqm_stat == "", "unknown", _dqm_stat)
+    return obs_table
+
+
+def _used_columns(obs_table):
+    """
+    Return table with columns required for run selection and reporting only.
+
+    """
+
+    return obs_table[[col for col in _OBS_TABLE_COLUMNS if col in obs_table.colnames]]
 
 
 def _apply_selection_cuts(obs_table, args_dict, target):
@@ -74,54 +144,108 @@ def _apply_selection_cuts(obs_table, args_dict, target):
 
     """
 
+    cuts = _selection_cuts(args_dict, target)
+
     if target is not None:
-        obs_table = _apply_cut_target(obs_table, args_dict, target)
-    obs_table = _apply_cut_mjd(obs_table, args_dict)
-    obs_table = _apply_cut_atmosphere(obs_table, args_dict, target)
-    obs_table = _apply_cut_dqm(obs_table, args_dict, target)
-    obs_table = _apply_cut_ontime_min(obs_table, args_dict, target)
-    obs_table = _apply_cut_ntel_min(obs_table, args_dict, target)
-    obs_table = _apply_cut_l3rate(obs_table, args_dict, target)
+        obs_table = _apply_cut_target(obs_table, cuts, target)
+    obs_table = _apply_cut_mjd(obs_table, cuts)
+    obs_table = _apply_cut_atmosphere(obs_table, cuts, target)
+    obs_table = _apply_cut_dqm(obs_table, cuts, target)
+    obs_table = _apply_cut_ontime_min(obs_table, cuts, target)
+    obs_table = _apply_cut_ntel_min(obs_table, cuts, target)
+    obs_table = _apply_cut_l3rate(obs_table, cuts, target)
     return obs_table
 
 
-def _apply_cut_l3rate(obs_table, args_dict, target):
+def _selection_cuts(args_dict, target):
+    """
+    Return selection cut values from configuration.
+
+    Values with units are converted to plain floats (ontime in s, L3 rates in Hz,
+    observation cone radii in deg).
+
+    Parameters
+    ----------
+    args_dict : dict
+        Dictionary of configuration arguments.
+    target : SkyCoord
+        Target coordinates (observation cone radii are required if not None).
+
+    Returns
+    -------
+    dict
+        Selection cut values.
+
+    """
+
+    cuts = {
+        "ntel_min": _get_cut_value(args_dict, "dqm", "ntel_min"),
+        "ontime_min": u.Quantity(_get_cut_value(args_dict, "dqm", "ontime_min")).to_value(u.s),
+        "dqm_stat": _get_cut_value(args_dict, "dqm", "dqmstat"),
+        "weather": _get_cut_value(args_dict, "atmosphere", "weather"),
+        "mjd_min": args_dict.get("observations", {}).get("mjd_min"),
+        "mjd_max": args_dict.get("observations", {}).get("mjd_max"),
+    }
+
+    _l3_rate_min = args_dict["dqm"].get("l3_rate_min", {})
+    cuts["l3_rate_min"] = {
+        epoch: u.Quantity(_l3_rate_min.get(epoch, 0.0 * u.Hz)).to_value(u.Hz)
+        for epoch in ["V4", "V5", "V6", "V6_redHV"]
+    }
+
+    if target is not None:
+        cuts["obs_cone_radius_min"] = u.Quantity(
+            args_dict["observations"].get("obs_cone_radius_min", 0.0 * u.deg)
+        ).to_value(u.deg)
+        cuts["obs_cone_radius_max"] = u.Quantity(
+            _get_cut_value(args_dict, "observations", "obs_cone_radius_max")
+        ).to_value(u.deg)
+
+    return cuts
+
+
+def _get_cut_value(args_dict, section, key):
+    """
+    Return required cut value from configuration.
+
+    """
+
+    try:
+        return args_dict[section][key]
+    except KeyError:
+        _logger.error(f"KeyError: {section}.{key}")
+        raise
+
+
+def _apply_cut_l3rate(obs_table, cuts, target):
     """
     Apply epoch and observation mode dependent minimum L3 Rate cut
 
     """
 
     mask_V4, mask_V5, mask_V6, mask_V6_redHV = _epoch_masks(obs_table)
-    mask = np.ones(len(obs_table), dtype=bool)
+    # runs not assigned to any epoch are not cut
+    l3rate_min = np.full(len(obs_table), -np.inf)
+    _cut_info = []
     for epoch_mask, epoch in zip(
         [mask_V4, mask_V5, mask_V6, mask_V6_redHV], ["V4", "V5", "V6", "V6_redHV"]
     ):
-        try:
-            l3rate_min = u.Quantity(args_dict["dqm"]["l3_rate_min"][epoch]).to(u.Hz)
-        except KeyError:
-            l3rate_min = 0.0 * u.Hz
-        mask = np.array(
-            mask & [((obs_table["L3RATE"] > l3rate_min.value) & epoch_mask) | ~epoch_mask]
-        )
-        _print_removed_runs(
-            obs_table, mask[0], "L3RATE", f"{epoch} L3Rate > {l3rate_min}", target is not None
-        )
-    return obs_table[mask[0]]
+        l3rate_min[epoch_mask] = cuts["l3_rate_min"][epoch]
+        _cut_info.append(f"{epoch} L3Rate > {cuts['l3_rate_min'][epoch]} Hz")
 
+    mask = np.asarray(obs_table["L3RATE"]) > l3rate_min
+    _print_removed_runs(obs_table, mask, "L3RATE", ", ".join(_cut_info), target is not None)
+    return obs_table[mask]
 
-def _apply_cut_ntel_min(obs_table, args_dict, target):
+
+def _apply_cut_ntel_min(obs_table, cuts, target):
     """
     Apply minimum telescope cut cut.
 
     """
 
-    try:
-        ntel_min = args_dict["dqm"]["ntel_min"]
-    except KeyError:
-        _logger.error("KeyError: dqm.ntel_min")
-        raise
-
-    mask = np.array([row["N_TELS"] >= ntel_min for row in obs_table])
+    ntel_min = cuts["ntel_min"]
+    mask = np.asarray(obs_table["N_TELS"]) >= ntel_min
     _print_removed_runs(obs_table, mask, "N_TELS", f"NTel >= {ntel_min}", target is not None)
     obs_table = obs_table[mask]
     if target is not None:
@@ -130,40 +254,35 @@ def _apply_cut_ntel_min(obs_table, args_dict, target):
     return obs_table
 
 
-def _apply_cut_mjd(obs_table, args_dict):
+def _apply_cut_mjd(obs_table, cuts):
     """
     Apply cut on MJD (min and max).
 
     """
 
-    if "mjd_min" in args_dict["observations"]:
-        _logger.info(f"Selecting runs after MJD {args_dict['observations']['mjd_min']}")
-        mjd_min = args_dict["observations"]["mjd_min"]
-        mask = np.array([Time(row["DATE-OBS"], scale="utc").mjd > mjd_min for row in obs_table])
+    if cuts["mjd_min"] is not None:
+        _logger.info(f"Selecting runs after MJD {cuts['mjd_min']}")
+        mjd_min = cuts["mjd_min"]
+        mask = Time(_string_column(obs_table, "DATE-OBS"), scale="utc").mjd > mjd_min
         obs_table = obs_table[mask]
-    if "mjd_max" in args_dict["observations"]:
-        _logger.info(f"Selecting runs after MJD {args_dict['observations']['mjd_max']}")
-        mjd_max = args_dict["observations"]["mjd_max"]
-        mask = np.array([Time(row["DATE-END"], scale="utc").mjd < mjd_max for row in obs_table])
+    if cuts["mjd_max"] is not None:
+        _logger.info(f"Selecting runs after MJD {cuts['mjd_max']}")
+        mjd_max = cuts["mjd_max"]
+        mask = Time(_string_column(obs_table, "DATE-END"), scale="utc").mjd < mjd_max
         obs_table = obs_table[mask]
 
     return obs_table
 
 
-def _apply_cut_ontime_min(obs_table, args_dict, target):
+def _apply_cut_ontime_min(obs_table, cuts, target):
     """
     Apply ontime min cut.
 
     """
 
-    try:
-        ontime_min = u.Quantity(args_dict["dqm"]["ontime_min"]).to(u.s)
-    except KeyError:
-        _logger.error("KeyError: dqm.ontime_min")
-        raise
-
-    mask = np.array([row["ONTIME"] > ontime_min.value for row in obs_table])
-    _print_removed_runs(obs_table, mask, "ONTIME", f"ontime < {ontime_min} m", target is not None)
+    ontime_min = cuts["ontime_min"]
+    mask = np.asarray(obs_table["ONTIME"]) > ontime_min
+    _print_removed_runs(obs_table, mask, "ONTIME", f"ontime > {ontime_min} s", target is not None)
     obs_table = obs_table[mask]
     if target is not None:
         _logger.info(f"Minimum run time: {np.min(obs_table['ONTIME'])} s")
@@ -171,19 +290,13 @@ def _apply_cut_ontime_min(obs_table, args_dict, target):
     return obs_table
 
 
-def _apply_cut_dqm(obs_table, args_dict, target):
+def _apply_cut_dqm(obs_table, cuts, target):
     """
     Apply dqm cuts
 
     """
 
-    try:
-        dqm_stat = args_dict["dqm"]["dqmstat"]
-    except KeyError:
-        _logger.error("KeyError: dqm.dqmstat")
-        raise
-
-    mask = np.array([row["DQMSTAT"] in dqm_stat for row in obs_table])
+    mask = _isin_column(_string_column(obs_table, "DQMSTAT"), cuts["dqm_stat"])
     _print_removed_runs(obs_table, mask, "DQMSTAT", "dqm status", target is not None)
     obs_table = obs_table[mask]
     if target is not None:
@@ -192,23 +305,17 @@ def _apply_cut_dqm(obs_table, args_dict, target):
     return obs_table
 
 
-def _apply_cut_atmosphere(obs_table, args_dict, target):
+def _apply_cut_atmosphere(obs_table, cuts, target):
     """
     Remove all fields in column "WEATHER" which are not in the list of args_dict.atmosphere.weather
 
     """
 
-    try:
-        weather = args_dict["atmosphere"]["weather"]
-    except KeyError:
-        _logger.error("KeyError: atmosphere.weather")
-        raise
-
-    try:
-        mask = np.array([row["WEATHER"][0] in weather for row in obs_table])
-    except IndexError:
+    _weather = _string_column(obs_table, "WEATHER")
+    if np.any(np.char.str_len(_weather) == 0):
         _logger.error("IndexError: weather")
-        raise
+        raise IndexError("Empty entry in column WEATHER")
+    mask = _isin_column(_weather.astype("U1"), cuts["weather"])
     _print_removed_runs(obs_table, mask, "WEATHER", "weather", target is not None)
     obs_table = obs_table[mask]
     if target is not None:
@@ -217,38 +324,35 @@ def _apply_cut_atmosphere(obs_table, args_dict, target):
     return obs_table
 
 
-def _apply_cut_target(obs_table, args_dict, target):
+def _apply_cut_target(obs_table, cuts, target):
     """
     Apply target cut.
 
     """
 
-    try:
-        obs_cone_radius_min = u.Quantity(args_dict["observations"]["obs_cone_radius_min"])
-    except KeyError:
-        obs_cone_radius_min = 0.0 * u.deg
-    try:
-        obs_cone_radius_max = u.Quantity(args_dict["observations"]["obs_cone_radius_max"])
-    except KeyError:
-        _logger.error("KeyError: observations.obs_cone_radius_mix missing")
-        raise
+    obs_cone_radius_min = cuts["obs_cone_radius_min"]
+    obs_cone_radius_max = cuts["obs_cone_radius_max"]
 
-    angular_separation = target.separation(
-        SkyCoord(obs_table["RA_PNT"], obs_table["DEC_PNT"], unit=(u.deg, u.deg))
+    pointing = SkyCoord(
+        np.asarray(obs_table["RA_PNT"]),
+        np.asarray(obs_table["DEC_PNT"]),
+        unit=(u.deg, u.deg),
+        frame="icrs",
     )
+    angular_separation = target.separation(pointing).deg
     obs_table = obs_table[
         (angular_separation > obs_cone_radius_min) & (angular_separation < obs_cone_radius_max)
     ]
 
     _logger.info(
         f"Selecting {len(obs_table)} runs from observation cone around {target}"
-        f"(min {obs_cone_radius_min}, max {obs_cone_radius_max})"
+        f"(min {obs_cone_radius_min} deg, max {obs_cone_radius_max} deg)"
     )
 
     return obs_table
 
 
-def _write_run_list(obs_table, output_dir):
+def _write_run_list(obs_table, output_dir, use_fitsio=False):
     """
     Write run list.
 
@@ -258,57 +362,93 @@ def _write_run_list(obs_table, output_dir):
         Observation table.
     output_dir : str
         Output directory.
+    use_fitsio : bool
+        Write run table using fitsio (CFITSIO); falls back to astropy if fitsio
+        is not installed.
 
     """
     _logger.info(f"Write run list to {output_dir}/run_list.txt")
 
-    column_data = obs_table[np.argsort(obs_table["OBS_ID"])]["OBS_ID"]
-    astropy.io.ascii.write(
-        column_data,
-        f"{output_dir}/run_list.txt",
-        overwrite=True,
-        format="no_header",
-        delimiter="\n",
-    )
+    _runs = np.sort(np.asarray(obs_table["OBS_ID"])).tolist()
+    Path(f"{output_dir}/run_list.txt").write_text("".join(f"{run}\n" for run in _runs))
 
     _logger.info(f"Write run table with selected runs to {output_dir}/run_list.fits.gz")
 
+    if use_fitsio and _write_table_fitsio(obs_table, f"{output_dir}/run_list.fits.gz"):
+        return
     obs_table.write(f"{output_dir}/run_list.fits.gz", overwrite=True)
 
 
-def _dqm_report(obs_table, output_dir):
+def _write_table_fitsio(table, file_name):
     """
-    Print list of selected runs to screen
+    Write table using fitsio (CFITSIO bindings).
+
+    Column units are written; table meta data is not.
+
+    Returns
+    -------
+    bool
+        True if table was written; False if fitsio is not available.
 
     """
 
-    obs_table.sort("OBS_ID")
-    # print general info
-    obs_table[
-        "OBS_ID",
-        "RUNTYPE",
-        "ONTIME",
-        "RA_PNT",
-        "DEC_PNT",
-        "RA_OBJ",
-        "DEC_OBJ",
-    ].pprint_all()
-
-    # print dqm
-    obs_table[
-        "OBS_ID",
-        "RUNTYPE",
-        "DATACAT",
-        "N_TELS",
-        "TELLIST",
-        "DQMSTAT",
-        "WEATHER",
-        "L3RATE",
-        "L3RATESD",
-        "FIRMEAN1",
-        "FIRCORM1",
-        "FIRSTD1",
-    ].pprint_all()
+    try:
+        import fitsio
+    except ImportError:
+        _logger.warning("fitsio not available; writing %s with astropy", file_name)
+        return False
+
+    units = [str(table[col].unit) if table[col].unit is not None else "" for col in table.colnames]
+    fitsio.write(file_name, table.as_array(), units=units, clobber=True)
+    return True
+
+
+def _dqm_report(obs_table, output_dir, print_tables=True):
+    """
+    Print list of selected runs (sorted by OBS_ID) to screen
+
+    Parameters
+    ----------
+    obs_table : `~astropy.table.Table`
+        Observation table.
+    output_dir : str
+        Output directory (outlier plots).
+    print_tables : bool
+        Print tables with general and dqm information for all selected runs.
+
+    """
+
+    if print_tables:
+        # print general info
+        _print_table(
+            obs_table[
+                "OBS_ID",
+                "RUNTYPE",
+                "ONTIME",
+                "RA_PNT",
+                "DEC_PNT",
+                "RA_OBJ",
+                "DEC_OBJ",
+            ]
+        )
+
+        # print dqm
+        _print_table(
+            obs_table[
+                "OBS_ID",
+                "RUNTYPE",
+                "DATACAT",
+                "N_TELS",
+                "TELLIST",
+                "DQMSTAT",
+                "WEATHER",
+                "L3RATE",
+                "L3RATESD",
+                "FIRMEAN1",
+                "FIRCORM1",
+                "FIRSTD1",
+            ]
+        )
 
     mask_V4, mask_V5, mask_V6, mask_V6_redHV = _epoch_masks(obs_table)
 
@@ -330,21 +470,31 @@ def _dqm_report(obs_table, output_dir):
     _print_outlier(obs_table, [True], "FIRSTD1", "all (deg)", output_dir, "max", True)
 
 
+def _print_table(table):
+    """
+    Print all rows and columns of a table with a single write to stdout.
+
+    """
+
+    sys.stdout.write("\n".join(table.pformat(max_lines=-1, max_width=-1)) + "\n")
+
+
 def _reject_outliers(data, m=3.0):
     """
     from
     stackoverflow.com/questions/11686720/is-there-a-numpy-builtin-to-reject-outliers-from-a-list
 
     """
-    d = np.abs(data - np.median(data))
+    center = np.median(data)
+    d = np.abs(data - center)
     mdev = np.median(d)
-    s = d / mdev if mdev else np.zeros(len(d))
-    return data[s < m], data[s > m], np.median(data), mdev
+    s = np.divide(d, mdev, out=np.zeros_like(d, dtype=float), where=mdev != 0)
+    return data[s < m], data[s > m], center, mdev
 
 
 def _outlier_lists(obs_table, string, column, center_measure, outlier_type, sigma=3.0):
     """
-    Return list of outliers for mean and median cuts.
+    Return mask of outliers for mean and median cuts.
 
     """
 
@@ -356,14 +506,16 @@ def _outlier_lists(obs_table, string, column, center_measure, outlier_type, sigm
         m = np.median(_data)
         s = np.median(np.abs(_data - m))
     print(f"{center_measure} {column} for {string}: {m:.2f} +- {s:.2f}")
+    diff = np.asarray(obs_table[column]) - m
+    threshold = sigma * s
     if outlier_type == "bounds":
-        outlier_list = [row["OBS_ID"] for row in obs_table if abs(row[column] - m) > sigma * s]
+        mask = np.abs(diff) > threshold
     elif outlier_type == "max":
-        outlier_list = [row["OBS_ID"] for row in obs_table if row[column] - m > sigma * s]
+        mask = diff > threshold
     elif outlier_type == "min":
-        outlier_list = [row["OBS_ID"] for row in obs_table if m - row[column] > sigma * s]
+        mask = -diff > threshold
 
-    return m, s, outlier_list
+    return m, s, mask
 
 
 def _print_outlier(
@@ -377,19 +529,19 @@ def _print_outlier(
     if log_axis:
         _obs_table_cleaned[column] = np.log10(_obs_table_cleaned[column])
 
-    _mean, _std, _outlier_list_mean = _outlier_lists(
+    _mean, _std, _outlier_mask_mean = _outlier_lists(
         _obs_table_cleaned, string, column, "Mean", outlier_type, sigma=2.0
     )
-    _median, _abs_deviation, _outlier_list_median = _outlier_lists(
+    _median, _abs_deviation, _outlier_mask_median = _outlier_lists(
         _obs_table_cleaned, string, column, "Median", outlier_type, sigma=3.0
     )
 
     print(f"{column} for {string}:")
-    print(f"    Outliers (mean,std): {_outlier_list_mean}")
-    _outlier_mask_mean = np.in1d(_obs_table_cleaned["OBS_ID"], _outlier_list_mean)
+    print(f"    Outliers (mean,std): {_obs_table_cleaned['OBS_ID'][_outlier_mask_mean].tolist()}")
     _obs_table_cleaned[_outlier_mask_mean].pprint_all()
-    print(f"    Outliers (median,abs): {_outlier_list_median}")
-    _outlier_mask_median = np.in1d(_obs_table_cleaned["OBS_ID"], _outlier_list_median)
+    print(
+        f"    Outliers (median,abs): {_obs_table_cleaned['OBS_ID'][_outlier_mask_median].tolist()}"
+    )
     _obs_table_cleaned[_outlier_mask_median].pprint_all()
 
     _plot_outliers(
@@ -459,17 +611,35 @@ def _epoch_masks(obs_table):
 
     """
 
-    mask_V4 = [row["OBS_ID"] < 46642 for row in obs_table]
-    mask_V5 = [row["OBS_ID"] < 63372 and row["OBS_ID"] > 46642 for row in obs_table]
-    mask_V6 = [row["OBS_ID"] > 63372 and row["RUNTYPE"] == "observing" for row in obs_table]
-    mask_V6_redHV = [row["OBS_ID"] > 63372 and row["RUNTYPE"] == "obsLowHV" for row in obs_table]
+    obs_id = np.asarray(obs_table["OBS_ID"])
+    runtype = _string_column(obs_table, "RUNTYPE")
 
-    return (
-        np.array(mask_V4),
-        np.array(mask_V5),
-        np.array(mask_V6),
-        np.array(mask_V6_redHV),
-    )
+    mask_V4 = obs_id < 46642
+    mask_V5 = (obs_id < 63372) & (obs_id > 46642)
+    mask_V6 = (obs_id > 63372) & (runtype == "observing")
+    mask_V6_redHV = (obs_id > 63372) & (runtype == "obsLowHV")
+
+    return mask_V4, mask_V5, mask_V6, mask_V6_redHV
+
+
+def _string_column(obs_table, column):
+    """
+    Return column as array of (unicode) strings.
+
+    String columns read from FITS files are byte strings.
+
+    """
+
+    return np.asarray(obs_table[column]).astype(str)
+
+
+def _isin_column(values, allowed):
+    """
+    Return mask of values which are in the list of allowed values.
+
+    """
+
+    return np.isin(values, np.asarray(list(allowed), dtype=str))
 
 
 def _print_removed_runs(obs_table, mask, column_name, cut_type, print=True):
@@ -481,7 +651,7 @@ def _print_removed_runs(obs_table, mask, column_name, cut_type, print=True):
     if not print:
         return
 
-    _logger.info(f"Remove {len(mask)-mask.sum(~False)} runs failing {cut_type} cut")
+    _logger.info(f"Remove {int((~mask).sum())} runs failing {cut_type} cut")
     _removed_runs = [f"{row['OBS_ID']} ({row[column_name]})" for row in obs_table[~mask]]
     _logger.info(f"Removed following run: {_removed_runs}")
-    _logger.info(f"Keep {mask.sum(~False)} runs after application of {cut_type} cut")
+    _logger.info(f"Keep {int(mask.sum())} runs after application of {cut_type} cut")
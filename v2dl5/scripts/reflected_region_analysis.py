@@ -16,6 +16,8 @@ Example using a run list:
 import argparse
 import logging
 
+import matplotlib
+
 import v2dl5.analysis
 import v2dl5.configuration
 import v2dl5.data
@@ -63,6 +65,9 @@ def main():
     logging.root.setLevel(logging.INFO)
 
     args_dict = v2dl5.configuration.configuration(args=_parse())
+    if not args_dict.get("interactive", False):
+        # all plots are written to files
+        matplotlib.use("Agg")
 
     sky_regions = v2dl5.sky_regions.SkyRegions(args_dict=args_dict)
     v2dl5_data = v2dl5.data.Data(args_dict=args_dict, target=sky_regions.target)
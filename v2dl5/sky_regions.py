@@ -3,15 +3,151 @@ Sky regions definition.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+import numpy as np
 from astropy import units as u
-from astropy.coordinates import Angle, SkyCoord, name_resolve
-from astropy.io import fits
+from astropy.coordinates import Angle, SkyCoord, name_resolve, search_around_sky
 from astropy.table import Table
-from gammapy.maps import WcsGeom
+from gammapy.maps import Map, WcsGeom
 from importlib_resources import files
 from regions import CircleSkyRegion
 
+# minimum number of (direction, center) pairs for which the numba kernel is used
+# (compiling the kernel takes about a second; NumPy needs a few ns per pair)
+_NUMBA_MIN_PAIRS = 100_000_000
+
+
+def _fill_exclusion_mask(ra, dec, centers_ra, centers_dec, hav_radius, mask):
+    """
+    Set mask to True for directions closer to any center than the given radius.
+
+    Uses the numba kernel for large problem sizes and the NumPy implementation
+    otherwise (all angles in rad). The haversine of the angular separation is used,
+    which is well conditioned for small angles also in single precision.
+
+    """
+
+    if ra.size * centers_ra.size >= _NUMBA_MIN_PAIRS:
+        _fill_exclusion_mask_numba(ra, dec, centers_ra, centers_dec, hav_radius, mask)
+    else:
+        _fill_exclusion_mask_numpy(ra, dec, centers_ra, centers_dec, hav_radius, mask)
+
+
+def _fill_exclusion_mask_numpy(ra, dec, centers_ra, centers_dec, hav_radius, mask):
+    """
+    Set mask to True for directions closer to any center than the given radius.
+
+    NumPy implementation looping over centers (all angles in rad).
+
+    """
+
+    cos_dec = np.cos(dec)
+    for k in range(centers_ra.size):
+        hav_sep = (
+            np.sin(0.5 * (dec - centers_dec[k])) ** 2
+            + cos_dec * np.cos(centers_dec[k]) * np.sin(0.5 * (ra - centers_ra[k])) ** 2
+        )
+        mask |= hav_sep < hav_radius[k]
+
+
+def _fill_exclusion_mask_numba(ra, dec, centers_ra, centers_dec, hav_radius, mask):
+    """
+    Set mask to True for directions closer to any center than the given radius.
+
+    Numba implementation (all angles in rad); falls back to the NumPy implementation
+    if numba is not installed.
+
+    """
+
+    kernel = _numba_kernel()
+    if kernel is None:
+        _fill_exclusion_mask_numpy(ra, dec, centers_ra, centers_dec, hav_radius, mask)
+    else:
+        kernel(ra, dec, centers_ra, centers_dec, hav_radius, mask)
+
+
+@lru_cache(maxsize=1)
+def _numba_kernel():
+    """
+    Build numba kernel parallelized over directions.
+
+    numba is optional and only imported at the first call. Returns None if numba
+    is not installed.
+
+    """
+
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True)
+    def kernel(ra, dec, centers_ra, centers_dec, hav_radius, mask):
+        half = np.float32(0.5)
+        cos_centers_dec = np.cos(centers_dec)
+        for i in prange(ra.size):
+            cos_dec = np.cos(dec[i])
+            for k in range(centers_ra.size):
+                hav_sep = (
+                    np.sin(half * (dec[i] - centers_dec[k])) ** 2
+                    + cos_dec * cos_centers_dec[k] * np.sin(half * (ra[i] - centers_ra[k])) ** 2
+                )
+                if hav_sep < hav_radius[k]:
+                    mask[i] = True
+                    break
+
+    return kernel
+
+
+@lru_cache(maxsize=1024)
+def _resolve_name(name):
+    """
+    Resolve target name (e.g., with Simbad); results are cached.
+
+    Names not found by the name resolver are cached as None, i.e., they are not
+    queried again (use _resolve_name.cache_clear() to retry). Failed queries
+    (e.g., network errors) raise a NameResolveError and are not cached.
+
+    Parameters
+    ----------
+    name : str
+        Target name.
+
+    Returns
+    -------
+    SkyCoord or None
+        Target coordinates (None if name cannot be resolved).
+
+    """
+
+    try:
+        return SkyCoord.from_name(name)
+    except name_resolve.NameResolveError as exc:
+        if "Unable to find coordinates" not in str(exc):
+            raise
+        return None
+
+
+def _to_angle(value):
+    """
+    Convert value to an Angle (values which are already an Angle are not parsed again).
+
+    Parameters
+    ----------
+    value : Angle, Quantity, or str
+        Angle value.
+
+    Returns
+    -------
+    Angle
+        Angle.
+
+    """
+
+    return value if isinstance(value, Angle) else Angle(value)
+
 
 class SkyRegions:
     """
@@ -30,7 +166,12 @@ class SkyRegions:
     def __init__(self, args_dict=None):
         self._logger = logging.getLogger(__name__)
 
+        self._target_cache = {}
+        self._geom_cache = {}
+        self._exclusion_mask_cache_key = None
+        self._exclusion_mask_cache = None
         self.target = self.get_target(sky_coord=args_dict["on_region"])
+        self._target_icrs = self.target.icrs
         self.on_region = self.define_on_region(on_region_dict=args_dict["on_region"])
         self.exclusion_mask = None
 
@@ -40,6 +181,9 @@ class SkyRegions:
         Reads target coordinates from Simbad if target name is given
         (use coordinates, if given)
 
+        Targets are cached by coordinates, frame and name, i.e., repeated calls
+        do not query Simbad again.
+
         Parameters
         ----------
         sky_coord : dict
@@ -50,10 +194,13 @@ class SkyRegions:
 
         """
 
-        target = None
+        _key = tuple(str(sky_coord.get(key)) for key in ("lon", "lat", "frame", "target"))
+        target = self._target_cache.get(_key)
         lon = sky_coord.get("lon", None)
         lat = sky_coord.get("lat", None)
-        if lon is not None and lat is not None:
+        if target is not None:
+            self._logger.debug(f"Target coordinates from cache: {target}")
+        elif lon is not None and lat is not None:
             if sky_coord.get("frame", None) == "icrs":
                 target = SkyCoord(
                     ra=lon,
@@ -71,11 +218,18 @@ class SkyRegions:
             self._logger.debug(f"Target coordinates from configuration: {target}")
         else:
             try:
-                target = SkyCoord.from_name(sky_coord["target"])
-                self._logger.debug("Target %s found in Simbad.", sky_coord["target"])
+                target = _resolve_name(sky_coord["target"])
             except name_resolve.NameResolveError:
-                self._logger.error('Target "%s" not found in Simbad.', sky_coord["target"])
+                self._logger.error('Name resolution failed for target "%s".', sky_coord["target"])
                 raise
+            if target is None:
+                self._logger.error('Target "%s" not found in Simbad.', sky_coord["target"])
+                raise name_resolve.NameResolveError(
+                    f'Unable to find coordinates for name "{sky_coord["target"]}"'
+                )
+            self._logger.debug("Target %s found in Simbad.", sky_coord["target"])
+
+        self._target_cache[_key] = target
 
         if print_target_info:
             self._logger.info("Target name: %s", sky_coord.get("target", "target name not given"))
@@ -83,6 +237,32 @@ class SkyRegions:
 
         return target
 
+    @classmethod
+    def resolve_names(cls, names, max_workers=8):
+        """
+        Resolve a list of target names in parallel.
+
+        Resolved names are cached and reused by get_target. Identical names are
+        resolved once.
+
+        Parameters
+        ----------
+        names : list of str
+            Target names.
+        max_workers : int
+            Maximum number of parallel requests.
+
+        Returns
+        -------
+        dict
+            Target coordinates (SkyCoord; None if name cannot be resolved) for each name.
+
+        """
+
+        names = list(dict.fromkeys(names))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(names, executor.map(_resolve_name, names)))
+
     def define_on_region(self, on_region_dict=None):
         """
         Defines a CircleSkyRegion object for the on region.
@@ -99,9 +279,10 @@ class SkyRegions:
 
         """
 
+        radius = on_region_dict.get("radius", 0.5 * u.deg)
         self.on_region = CircleSkyRegion(
             center=self.get_target(sky_coord=on_region_dict, print_target_info=False),
-            radius=Angle(on_region_dict.get("radius", 0.5 * u.deg)),
+            radius=_to_angle(radius),
         )
 
         self._logger.info(f"On region: {self.on_region}")
@@ -119,39 +300,130 @@ class SkyRegions:
         max_wobble_distance: Angle
             maximum wobble distance (with FOV radius added).
 
+        Returns
+        -------
+        Map
+            Exclusion mask (False for excluded pixels). The mask is cached and
+            recomputed only if the on region or exclusion region parameters change.
+
         """
 
-        exclusion_regions = []
+        _key = repr(
+            (
+                args_dict["on_region"],
+                args_dict["datasets"]["exclusion_region"],
+                max_wobble_distance,
+            )
+        )
+        if self._exclusion_mask_cache_key == _key:
+            self._logger.debug("Exclusion mask from cache")
+            return self._exclusion_mask_cache
+
+        # bright star exclusion
+        ra, dec, radius = self._read_bright_star_catalogue(
+            exclusion_region_dict=args_dict["datasets"]["exclusion_region"],
+            max_wobble_distance=max_wobble_distance,
+            as_arrays=True,
+        )
 
         # on region
         on_region_dict = args_dict["on_region"]
         on_region_exclusion_radius = args_dict["datasets"]["exclusion_region"]["on_radius"]
         if on_region_dict is not None and on_region_exclusion_radius is not None:
-            exclusion_regions.append(
-                CircleSkyRegion(
-                    center=self.get_target(sky_coord=on_region_dict, print_target_info=False),
-                    radius=Angle(on_region_exclusion_radius),
-                )
+            on_region_exclusion = CircleSkyRegion(
+                center=self.get_target(sky_coord=on_region_dict, print_target_info=False),
+                radius=_to_angle(on_region_exclusion_radius),
             )
-            self._logger.info(f"On region exclusion: {exclusion_regions[-1]}")
+            self._logger.info(f"On region exclusion: {on_region_exclusion}")
+            center = on_region_exclusion.center.icrs
+            ra = np.append(center.ra.deg, ra)
+            dec = np.append(center.dec.deg, dec)
+            radius = np.append(on_region_exclusion.radius.deg, radius)
 
-        # bright star exclusion
-        exclusion_regions.extend(
-            self._read_bright_star_catalogue(
-                exclusion_region_dict=args_dict["datasets"]["exclusion_region"],
-                max_wobble_distance=max_wobble_distance,
+        # exclusion mask
+        geom = self._get_geom(npix=(150, 150), binsz=0.05, proj="TAN", frame="icrs")
+
+        self._logger.info("Number of exclusion regions: %d", len(ra))
+        if len(ra) == 0:
+            exclusion_mask = Map.from_geom(geom, data=np.ones(geom.data_shape, dtype=bool))
+        else:
+            exclusion_mask = ~self._circle_region_mask(geom, ra, dec, radius)
+
+        self._exclusion_mask_cache_key = _key
+        self._exclusion_mask_cache = exclusion_mask
+        return exclusion_mask
+
+    def _get_geom(self, npix, binsz, proj, frame):
+        """
+        Map geometry centered on the target.
+
+        Geometries are cached by target position and geometry parameters.
+
+        Parameters
+        ----------
+        npix : tuple of int
+            Number of pixels.
+        binsz : float
+            Pixel size (deg).
+        proj : str
+            Projection.
+        frame : str
+            Coordinate frame.
+
+        Returns
+        -------
+        WcsGeom
+            Map geometry.
+
+        """
+
+        _key = (self._target_icrs.ra.deg, self._target_icrs.dec.deg, npix, binsz, proj, frame)
+        if _key not in self._geom_cache:
+            self._geom_cache[_key] = WcsGeom.create(
+                npix=npix, binsz=binsz, skydir=self._target_icrs, proj=proj, frame=frame
             )
-        )
+        return self._geom_cache[_key]
 
-        # exclusion mask
-        geom = WcsGeom.create(
-            npix=(150, 150), binsz=0.05, skydir=self.target.galactic, proj="TAN", frame="icrs"
-        )
+    def _circle_region_mask(self, geom, ra, dec, radius):
+        """
+        Mask of pixels with centers inside any of the given circular sky regions.
 
-        self._logger.info("Number of exclusion regions: %d", len(exclusion_regions))
-        return ~geom.region_mask(exclusion_regions)
+        Uses angular distances between pixel centers and region centers (instead of
+        the pixel-space containment test of geom.region_mask).
 
-    def _read_bright_star_catalogue(self, exclusion_region_dict=None, max_wobble_distance=None):
+        Parameters
+        ----------
+        geom : WcsGeom
+            Map geometry.
+        ra : numpy.ndarray
+            Right ascension of region centers (ICRS; deg).
+        dec : numpy.ndarray
+            Declination of region centers (ICRS; deg).
+        radius : numpy.ndarray
+            Region radii (deg).
+
+        Returns
+        -------
+        Map
+            Boolean mask (True for pixels inside regions).
+
+        """
+
+        coords = geom.get_coord().skycoord.icrs
+        mask = np.zeros(coords.shape, dtype=bool).ravel()
+        _fill_exclusion_mask(
+            np.ascontiguousarray(coords.ra.rad, dtype=np.float32).ravel(),
+            np.ascontiguousarray(coords.dec.rad, dtype=np.float32).ravel(),
+            np.deg2rad(ra).astype(np.float32),
+            np.deg2rad(dec).astype(np.float32),
+            (np.sin(0.5 * np.deg2rad(radius)) ** 2).astype(np.float32),
+            mask,
+        )
+        return Map.from_geom(geom, data=mask.reshape(coords.shape))
+
+    def _read_bright_star_catalogue(
+        self, exclusion_region_dict=None, max_wobble_distance=None, as_arrays=False
+    ):
         """
         Read bright star catalogue from file.
 
@@ -164,50 +436,98 @@ class SkyRegions:
             Dictionary of configuration arguments.
         max_wobble_distance: Angle
             maximum wobble distance (with FOV radius added).
+        as_arrays: bool
+            Return arrays of ICRS RA, Dec, and radius (deg) instead of regions.
 
         Returns
         -------
-        List of CircleSkyRegion
+        List of CircleSkyRegion (or tuple of numpy.ndarray for as_arrays=True)
             List exclusion regions due to bright stars.
 
         """
 
         _exclusion_regions = []
         if exclusion_region_dict["star_file"] is None:
+            if as_arrays:
+                return np.empty(0), np.empty(0), np.empty(0)
             return _exclusion_regions
 
         self._logger.info(
             "Reading bright star catalogue from %s", exclusion_region_dict["star_file"]
         )
         star_file = files("v2dl5.data").joinpath("data/" + exclusion_region_dict["star_file"])
-        hip = fits.open(star_file)
-
-        catalogue = Table(hip[1].data)
+        catalogue = Table.read(star_file, hdu=1, memmap=True)
+        catalogue = catalogue["HIP", "Vmag", "B-V", "_RA_icrs", "_DE_icrs"]
         catalogue = catalogue[
             catalogue["Vmag"] + catalogue["B-V"] < exclusion_region_dict["magnitude_B"]
         ]
 
-        catalogue["angular_separation"] = self.target.separation(
-            SkyCoord(catalogue["_RA_icrs"], catalogue["_DE_icrs"], unit=u.deg)
+        max_distance = u.Quantity(max_wobble_distance, u.deg)
+        catalogue = catalogue[
+            self._bounding_box_mask(
+                catalogue["_RA_icrs"], catalogue["_DE_icrs"], max_distance.to_value(u.deg)
+            )
+        ]
+        centers = SkyCoord(
+            np.asarray(catalogue["_RA_icrs"]), np.asarray(catalogue["_DE_icrs"]), unit=u.deg
         )
-
-        catalogue = catalogue[catalogue["angular_separation"] < u.Quantity(max_wobble_distance)]
+        _, idx, _, _ = search_around_sky(self._target_icrs.reshape((1,)), centers, max_distance)
+        idx = np.sort(idx)
+        catalogue = catalogue[idx]
+        centers = centers[idx]
 
         self._logger.info(
             "Number of stars in the catalogue passing cuts on magnitude and FOV: %d", len(catalogue)
         )
-        print(catalogue.pprint_all())
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("\n%s", "\n".join(catalogue.pformat(max_lines=-1, max_width=-1)))
 
-        for row in catalogue:
-            _exclusion_regions.append(
-                CircleSkyRegion(
-                    center=SkyCoord(row["_RA_icrs"], row["_DE_icrs"], unit=u.deg),
-                    radius=Angle(exclusion_region_dict["star_exclusion_radius"]),
-                )
-            )
+        star_radius = _to_angle(exclusion_region_dict["star_exclusion_radius"])
+        if as_arrays:
+            return centers.ra.deg, centers.dec.deg, np.full(len(centers), star_radius.deg)
+
+        _exclusion_regions = [
+            CircleSkyRegion(center=center, radius=star_radius) for center in centers
+        ]
 
         return _exclusion_regions
 
+    def _bounding_box_mask(self, ra, dec, radius):
+        """
+        Pre-selection of (ICRS) directions in a RA/Dec box around the target.
+
+        The box contains all directions within the given radius around the target;
+        no cut on RA is applied if the circle contains a celestial pole.
+
+        Parameters
+        ----------
+        ra : array-like
+            Right ascension (deg).
+        dec : array-like
+            Declination (deg).
+        radius : float
+            Radius (deg).
+
+        Returns
+        -------
+        numpy.ndarray
+            Mask of directions inside the box.
+
+        """
+
+        target_ra = self._target_icrs.ra.deg
+        target_dec = self._target_icrs.dec.deg
+
+        mask = np.abs(np.asarray(dec) - target_dec) < radius
+        if abs(target_dec) + radius >= 90.0:
+            return mask
+
+        max_delta_ra = np.rad2deg(
+            np.arcsin(np.sin(np.deg2rad(radius)) / np.cos(np.deg2rad(target_dec)))
+        )
+        delta_ra = np.abs((np.asarray(ra) - target_ra + 180.0) % 360.0 - 180.0)
+        return mask & (delta_ra <= max_delta_ra)
+
     def update_regions(self, args_dict, on_region_radius=None, max_wobble_distance=None):
         """
         Update on and exclusion region definitions
@@ -223,7 +543,10 @@ class SkyRegions:
 
         """
 
+        if on_region_radius is not None:
+            on_region_radius = _to_angle(on_region_radius)
         args_dict["on_region"]["radius"] = on_region_radius
         self.define_on_region(on_region_dict=args_dict["on_region"])
 
+        self._exclusion_mask_cache_key = None
         self.exclusion_mask = self.get_exclusion_mask(args_dict, max_wobble_distance)
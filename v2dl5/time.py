@@ -79,7 +79,9 @@ def get_time_bins_from_file(file_name):
     """
     _time_bins = []
     _time_table = Table.read(file_name)
-    for _row in _time_table:
-        _time_bins.append(Time([_row["time_min"], _row["time_max"]], format="mjd", scale="utc"))
+    for _time_min, _time_max in zip(
+        _time_table["time_min"].tolist(), _time_table["time_max"].tolist()
+    ):
+        _time_bins.append(Time([_time_min, _time_max], format="mjd", scale="utc"))
 
     return _time_bins